@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Run the F25 and S26 order imports back-to-back over one connection
+"""
+
+from bulk_import import connect, run_import
+from import_f25_orders import IMPORT_CONFIG as F25_CONFIG
+from import_s26_orders import IMPORT_CONFIG as S26_CONFIG
+
+def main():
+    # One connection for both seasons: the TLS handshake, auth, and the
+    # brand/location lookups are paid once instead of per script
+    conn = connect()
+    try:
+        run_import(conn, **F25_CONFIG)
+        run_import(conn, **S26_CONFIG)
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    main()